@@ -28,6 +28,9 @@ INPUT_DIR = Path("biblioteca_suseso")
 OUTPUT_PATH = INPUT_DIR / "compendio_suseso.xml"
 SOURCE_URL = "https://www.suseso.cl/620/w3-propertyname-785.html"
 
+# Parser para el compendio generado: no usa entidades, DTD ni xml:id
+XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, collect_ids=False)
+
 NUMEROS_ROMANOS = {
     1: "I", 2: "II", 3: "III", 4: "IV", 5: "V",
     6: "VI", 7: "VII", 8: "VIII",
@@ -271,11 +274,14 @@ def _agregar_contenido_nodo(
 
 def validar_xml(xml_path: Path, schema_path: Path) -> bool:
     """Valida un archivo XML contra el schema XSD."""
+    return validar_documento(etree.parse(str(xml_path), XML_PARSER), schema_path)
+
+
+def validar_documento(doc: etree._ElementTree | etree._Element, schema_path: Path) -> bool:
+    """Valida un documento ya parseado contra el schema XSD."""
     schema_doc = etree.parse(str(schema_path))
     schema = etree.XMLSchema(schema_doc)
 
-    doc = etree.parse(str(xml_path))
-
     if schema.validate(doc):
         print(f"  Validación OK contra {schema_path}")
         return True
@@ -292,17 +298,29 @@ def validar_xml(xml_path: Path, schema_path: Path) -> bool:
 
 
 def contar_elementos(root: etree._Element) -> dict[str, int]:
-    """Cuenta elementos en el XML generado."""
+    """Cuenta elementos en el XML generado (un solo recorrido del árbol)."""
     ns = f"{{{NAMESPACE}}}"
+    tag_seccion = f"{ns}seccion"
+    tag_contenido = f"{ns}contenido"
+    tag_parrafo = f"{ns}parrafo"
+    tag_ref = f"{ns}ref"
+
     stats = {
-        "libros": len(root.findall(f"{ns}libro")),
-        "secciones": len(root.findall(f".//{ns}seccion")),
-        "secciones_con_contenido": len(
-            [s for s in root.findall(f".//{ns}seccion") if s.find(f"{ns}contenido") is not None]
-        ),
-        "parrafos": len(root.findall(f".//{ns}parrafo")),
-        "referencias": len(root.findall(f".//{ns}ref")),
+        "libros": sum(1 for _ in root.iterchildren(f"{ns}libro")),
+        "secciones": 0,
+        "secciones_con_contenido": 0,
+        "parrafos": 0,
+        "referencias": 0,
     }
+    for elem in root.iter(tag_seccion, tag_parrafo, tag_ref):
+        if elem.tag == tag_parrafo:
+            stats["parrafos"] += 1
+        elif elem.tag == tag_ref:
+            stats["referencias"] += 1
+        else:
+            stats["secciones"] += 1
+            if elem.find(tag_contenido) is not None:
+                stats["secciones_con_contenido"] += 1
     return stats
 
 
@@ -367,15 +385,16 @@ def main() -> None:
     # Generar XML
     root = crear_compendio_xml(indice, args.input, libros_filtro)
 
-    # Escribir
+    # Serializar una vez: los mismos bytes se escriben y se validan
     tree = etree.ElementTree(root)
     etree.indent(tree, space="  ")
-    tree.write(
-        str(args.output),
+    xml_bytes = etree.tostring(
+        tree,
         xml_declaration=True,
         encoding="UTF-8",
         pretty_print=True,
     )
+    args.output.write_bytes(xml_bytes)
     print(f"XML generado: {args.output}")
 
     # Estadísticas
@@ -386,9 +405,9 @@ def main() -> None:
     print(f"  Párrafos: {stats['parrafos']}")
     print(f"  Referencias: {stats['referencias']}")
 
-    # Validar
+    # Validar desde memoria (mismos números de línea que el archivo escrito)
     print()
-    validar_xml(args.output, SCHEMA_PATH)
+    validar_documento(etree.fromstring(xml_bytes, XML_PARSER), SCHEMA_PATH)
 
 
 if __name__ == "__main__":
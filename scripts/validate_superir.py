@@ -25,6 +25,18 @@ NCG_DIR = PROJECT_ROOT / "biblioteca_xml" / "organismos" / "SUPERIR" / "NCG"
 NS = "https://superir.cl/schema/norma/v1"
 NSMAP = {"n": NS}
 
+# Tags en notación Clark, formateados una vez
+TAG_ARTICULO = f"{{{NS}}}articulo"
+TAG_ANEXO = f"{{{NS}}}anexo"
+
+# Rutas desde <norma>: según el XSD, materias y referencias solo viven en <metadatos>
+PATH_NCG_REF = f"{{{NS}}}metadatos/{{{NS}}}ncg_referenciadas/{{{NS}}}ncg_ref"
+PATH_LEY_REF = f"{{{NS}}}metadatos/{{{NS}}}leyes_referenciadas/{{{NS}}}ley_ref"
+PATH_MATERIA = f"{{{NS}}}metadatos/{{{NS}}}materias/{{{NS}}}materia"
+
+# Parser para los XML de la biblioteca: no usan entidades, DTD ni xml:id
+XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, collect_ids=False)
+
 
 def load_schema() -> etree.XMLSchema:
     """Carga y compila el XSD."""
@@ -32,22 +44,19 @@ def load_schema() -> etree.XMLSchema:
     return etree.XMLSchema(schema_doc)
 
 
-def validate_xsd(xml_path: Path, schema: etree.XMLSchema, verbose: bool = False) -> list[str]:
-    """Valida un XML contra el XSD. Retorna lista de errores."""
+def validate_xsd(
+    doc: etree._ElementTree, schema: etree.XMLSchema, verbose: bool = False
+) -> list[str]:
+    """Valida un documento ya parseado contra el XSD. Retorna lista de errores."""
     errors = []
-    try:
-        doc = etree.parse(str(xml_path))
-        if not schema.validate(doc):
-            for error in schema.error_log:
-                errors.append(f"  XSD: línea {error.line}: {error.message}")
-    except etree.XMLSyntaxError as e:
-        errors.append(f"  XML malformado: {e}")
+    if not schema.validate(doc):
+        for error in schema.error_log:
+            errors.append(f"  XSD: línea {error.line}: {error.message}")
     return errors
 
 
-def extract_ncg_refs(xml_path: Path) -> dict:
-    """Extrae metadatos y referencias de una NCG."""
-    doc = etree.parse(str(xml_path))
+def extract_ncg_refs(doc: etree._ElementTree) -> dict:
+    """Extrae metadatos y referencias de una NCG ya parseada."""
     root = doc.getroot()
 
     numero = root.get("numero", "?")
@@ -55,7 +64,7 @@ def extract_ncg_refs(xml_path: Path) -> dict:
 
     # ncg_referenciadas
     refs = []
-    for ref in root.findall(f".//{{{NS}}}ncg_ref"):
+    for ref in root.iterfind(PATH_NCG_REF):
         refs.append({
             "numero": ref.get("numero"),
             "relacion": ref.get("relacion"),
@@ -63,19 +72,22 @@ def extract_ncg_refs(xml_path: Path) -> dict:
 
     # leyes_referenciadas (verificar que no queden NCGs aquí)
     ley_refs_ncg = []
-    for ref in root.findall(f".//{{{NS}}}ley_ref"):
+    for ref in root.iterfind(PATH_LEY_REF):
         if ref.get("tipo") == "NCG":
             ley_refs_ncg.append(ref.get("numero"))
 
     # Materias
-    materias = [m.text for m in root.findall(f".//{{{NS}}}materia") if m.text]
+    materias = [m.text for m in root.iterfind(PATH_MATERIA) if m.text]
 
     # Contar artículos
-    articulos = root.findall(f".//{{{NS}}}articulo")
+    n_articulos = sum(1 for _ in root.iter(TAG_ARTICULO))
 
-    # Contar anexos
-    anexos = root.findall(f"{{{NS}}}anexo")
-    anexos_pendientes = [a for a in anexos if a.get("pendiente") == "true"]
+    # Contar anexos (hijos directos de <norma>)
+    n_anexos = n_anexos_pendientes = 0
+    for anexo in root.iterchildren(TAG_ANEXO):
+        n_anexos += 1
+        if anexo.get("pendiente") == "true":
+            n_anexos_pendientes += 1
 
     return {
         "numero": numero,
@@ -83,16 +95,42 @@ def extract_ncg_refs(xml_path: Path) -> dict:
         "ncg_refs": refs,
         "ley_refs_ncg_residuales": ley_refs_ncg,
         "materias": materias,
-        "n_articulos": len(articulos),
-        "n_anexos": len(anexos),
-        "n_anexos_pendientes": len(anexos_pendientes),
+        "n_articulos": n_articulos,
+        "n_anexos": n_anexos,
+        "n_anexos_pendientes": n_anexos_pendientes,
     }
 
 
+def check_file(
+    xml_path: Path, schema: etree.XMLSchema, verbose: bool = False
+) -> tuple[list[str], dict | None]:
+    """Valida una NCG y extrae sus datos. Retorna (errores, datos).
+
+    El archivo se parsea una sola vez y el mismo documento se usa para la
+    validación XSD y para la extracción de referencias.
+    """
+    try:
+        doc = etree.parse(str(xml_path), XML_PARSER)
+    except etree.XMLSyntaxError as e:
+        return [f"  XML malformado: {e}"], None
+
+    errors = validate_xsd(doc, schema, verbose)
+    try:
+        data = extract_ncg_refs(doc)
+    except Exception as e:
+        errors.append(f"  Error extrayendo datos: {e}")
+        data = None
+    return errors, data
+
+
 def check_cross_references(all_data: dict[str, dict]) -> list[str]:
     """Verifica consistencia bidireccional de referencias cruzadas."""
     errors = []
-    ncg_numbers = {d["numero"] for d in all_data.values()}
+
+    # Índice numero → datos (la primera NCG gana si hubiera duplicados)
+    by_numero: dict[str, dict] = {}
+    for d in all_data.values():
+        by_numero.setdefault(d["numero"], d)
 
     # Mapa inverso de relaciones
     inverse = {
@@ -131,12 +169,7 @@ def check_cross_references(all_data: dict[str, dict]) -> list[str]:
             expected_inverse = inverse[rel]
 
             # Buscar la NCG referenciada en el corpus
-            target_data = None
-            for d in all_data.values():
-                if d["numero"] == ref_num:
-                    target_data = d
-                    break
-
+            target_data = by_numero.get(ref_num)
             if target_data is None:
                 # NCG referenciada no está en el corpus - no es error
                 continue
@@ -221,16 +254,10 @@ def main():
             total_errors += 1
             continue
 
-        # Validación XSD
-        xsd_errors = validate_xsd(xml_path, schema, args.verbose)
-
-        # Extraer datos
-        try:
-            data = extract_ncg_refs(xml_path)
+        # Validación XSD + extracción de datos (un solo parse)
+        xsd_errors, data = check_file(xml_path, schema, args.verbose)
+        if data is not None:
             all_data[str(xml_path)] = data
-        except Exception as e:
-            xsd_errors.append(f"  Error extrayendo datos: {e}")
-            data = None
 
         if xsd_errors:
             print(f"  {xml_path.name}: {len(xsd_errors)} error(es)")
@@ -6,6 +6,17 @@ para testear el parser con input en MD.
 import xml.etree.ElementTree as ET
 from pathlib import Path
 
+LEY_NS = 'https://leychile.cl/schema/ley/v1'
+PREFIJO_LEY = f'{{{LEY_NS}}}'
+LARGO_PREFIJO_LEY = len(PREFIJO_LEY)
+
+# Hijos de una división que no se procesan como elementos (con y sin namespace)
+TAGS_OMITIDOS = frozenset(
+    t
+    for nombre in ('titulo_seccion', 'texto', 'contexto')
+    for t in (nombre, f'{{{LEY_NS}}}{nombre}')
+)
+
 
 def xml_a_markdown(xml_path: Path) -> str:
     """Convierte un XML de la biblioteca a formato Markdown."""
@@ -13,7 +24,7 @@ def xml_a_markdown(xml_path: Path) -> str:
     root = tree.getroot()
     
     # Manejar namespace
-    ns = {'ley': 'https://leychile.cl/schema/ley/v1'}
+    ns = {'ley': LEY_NS}
     
     def find_elem(parent, tag):
         """Busca elemento con o sin namespace."""
@@ -69,6 +80,8 @@ def xml_a_markdown(xml_path: Path) -> str:
     def get_tag_local(elem):
         """Obtiene el tag sin namespace."""
         tag = elem.tag
+        if tag.startswith(PREFIJO_LEY):
+            return tag[LARGO_PREFIJO_LEY:]
         if '}' in tag:
             tag = tag.split('}')[1]
         return tag
@@ -98,8 +111,7 @@ def xml_a_markdown(xml_path: Path) -> str:
             
             # Procesar hijos
             for hijo in elem:
-                hijo_tag = get_tag_local(hijo)
-                if hijo_tag not in ('titulo_seccion', 'texto', 'contexto'):
+                if hijo.tag not in TAGS_OMITIDOS:
                     lines.extend(procesar_elemento(hijo, nivel_h + 1))
         
         elif tag == 'articulo':
@@ -9,6 +9,7 @@ Independiente de LawXMLGenerator (ley_v1.xsd).
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -31,6 +32,12 @@ NSMAP = {None: SUPERIR_NS}
 SCHEMA_PATH = Path(__file__).parent.parent.parent / "schemas" / "superir_v1.xsd"
 
 
+@functools.cache
+def _compile_schema(schema_path: Path) -> etree.XMLSchema:
+    """Compila un XSD una sola vez por proceso y ruta."""
+    return etree.XMLSchema(etree.parse(str(schema_path)))
+
+
 class SuperirXMLGenerator:
     """Genera XML conforme a superir_v1.xsd desde NormaSuperir.
 
@@ -49,11 +56,10 @@ class SuperirXMLGenerator:
         self._schema: etree.XMLSchema | None = None
 
     def _load_schema(self) -> etree.XMLSchema:
-        """Carga y cachea el schema XSD."""
+        """Carga el schema XSD, compartido entre instancias."""
         if self._schema is None:
             if self._schema_path.exists():
-                schema_doc = etree.parse(str(self._schema_path))
-                self._schema = etree.XMLSchema(schema_doc)
+                self._schema = _compile_schema(self._schema_path)
             else:
                 logger.warning(f"Schema no encontrado: {self._schema_path}")
         return self._schema
@@ -67,6 +73,20 @@ class SuperirXMLGenerator:
         Returns:
             XML string validado contra superir_v1.xsd.
         """
+        return self._serialize(self.generate_tree(norma))
+
+    def generate_tree(self, norma: NormaSuperir) -> etree._Element:
+        """Genera el árbol XML desde NormaSuperir, sin serializarlo.
+
+        Útil cuando el consumidor trabaja con lxml directamente y así
+        evita serializar y volver a parsear el documento.
+
+        Args:
+            norma: NormaSuperir con datos estructurados.
+
+        Returns:
+            Elemento raíz <norma>, validado contra superir_v1.xsd.
+        """
         root = self._create_root(norma)
         self._add_acto_administrativo(root, norma)
         self._add_encabezado(root, norma)
@@ -82,12 +102,10 @@ class SuperirXMLGenerator:
         self._add_anexos(root, norma)
         self._add_standalone_anexos(root, norma)
 
-        xml_str = self._serialize(root)
-
-        # Validar
-        self._validate(xml_str)
+        # Validar el árbol en memoria (sin re-parsear el string serializado)
+        self._validate(root)
 
-        return xml_str
+        return root
 
     # ───────────────────────────────────────────────────────────────────────
     # Elemento raíz
@@ -663,16 +681,15 @@ class SuperirXMLGenerator:
         dom = parseString(f'<?xml version="1.0" encoding="UTF-8"?>{rough}')
         return dom.toprettyxml(indent="  ", encoding=None)
 
-    def _validate(self, xml_str: str) -> bool:
-        """Valida XML contra superir_v1.xsd."""
+    def _validate(self, root: etree._Element) -> bool:
+        """Valida el árbol XML contra superir_v1.xsd."""
         schema = self._load_schema()
         if not schema:
             logger.warning("No se puede validar: schema no disponible")
             return False
 
         try:
-            doc = etree.fromstring(xml_str.encode("utf-8"))
-            is_valid = schema.validate(doc)
+            is_valid = schema.validate(root)
             if not is_valid:
                 for error in schema.error_log:
                     logger.error(f"Validación XSD: {error}")
@@ -13,6 +13,7 @@ El formato XML está diseñado para:
 Author: Luis Aguilera Arteaga <luis@aguilera.cl>
 """
 
+import functools
 import logging
 import re
 from datetime import datetime
@@ -31,6 +32,12 @@ logger = logging.getLogger("leychile_epub.xml_generator")
 _SCHEMA_PATH = Path(__file__).parent.parent.parent / "schemas" / "ley_v1.xsd"
 
 
+@functools.cache
+def _compile_schema(schema_path: Path) -> etree.XMLSchema:
+    """Compila un XSD una sola vez por proceso y ruta."""
+    return etree.XMLSchema(etree.parse(str(schema_path)))
+
+
 class LawXMLGenerator:
     """Generador de XML estructurado para leyes chilenas.
 
@@ -637,10 +644,8 @@ class LawXMLGenerator:
             return []
 
         try:
-            xml_str = ET.tostring(root, encoding="unicode")
-            lxml_doc = etree.fromstring(xml_str.encode("utf-8"))
-            schema_doc = etree.parse(str(_SCHEMA_PATH))
-            schema = etree.XMLSchema(schema_doc)
+            lxml_doc = etree.fromstring(ET.tostring(root, encoding="utf-8"))
+            schema = _compile_schema(_SCHEMA_PATH)
 
             if schema.validate(lxml_doc):
                 logger.debug("XML válido según esquema XSD")
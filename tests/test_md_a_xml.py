@@ -12,6 +12,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
 
 from leychile_epub.text_to_xml_parser import NormaTextParser
 
+# Tag de artículo con y sin namespace, para comparar directo contra elem.tag
+TAGS_ARTICULO = frozenset(('articulo', f'{{{NormaTextParser.NAMESPACE}}}articulo'))
+
 
 def extraer_metadatos_md(contenido: str) -> dict:
     """Extrae metadatos del frontmatter del Markdown."""
@@ -64,8 +67,7 @@ def contar_articulos_xml(xml_str: str) -> list:
     articulos = []
     
     def buscar_articulos(elem):
-        tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-        if tag == 'articulo':
+        if elem.tag in TAGS_ARTICULO:
             num = elem.get('numero', '')
             articulos.append(num)
         for hijo in elem:
@@ -122,8 +124,7 @@ def run_md_a_xml(md_path: Path):
         # Contar artículos originales
         arts_orig = []
         for elem in root.iter():
-            tag = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-            if tag == 'articulo':
+            if elem.tag in TAGS_ARTICULO:
                 arts_orig.append(elem.get('numero', ''))
         
         print("\n⚖️  Comparación con original:")
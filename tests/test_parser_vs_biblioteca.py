@@ -18,6 +18,21 @@ from leychile_epub.text_to_xml_parser import NormaTextParser
 # Configuración
 BIBLIOTECA_PATH = Path(__file__).parent.parent / "biblioteca_xml"
 NS = {"ley": "https://leychile.cl/schema/ley/v1"}
+DIVISIONES = ('libro', 'titulo', 'capitulo', 'parrafo', 'seccion')
+
+
+def _tags(nombre: str) -> frozenset[str]:
+    """Tag con y sin namespace (notación Clark), para comparar contra ``elem.tag``."""
+    return frozenset((nombre, f"{{{NS['ley']}}}{nombre}"))
+
+
+# Tags precalculados: se comparan directo contra elem.tag, sin extraer el nombre local
+TAGS_ARTICULO = _tags('articulo')
+TAGS_INCISO = _tags('inciso')
+TAGS_CONTENIDO = _tags('contenido')
+TAGS_PARRAFO = _tags('parrafo')
+TAGS_TITULO_SECCION = _tags('titulo_seccion')
+TAG_A_DIVISION = {tag: nombre for nombre in DIVISIONES for tag in _tags(nombre)}
 
 
 def extraer_texto_plano_de_xml(xml_path: Path) -> tuple[str, dict, dict]:
@@ -74,8 +89,7 @@ def extraer_texto_plano_de_xml(xml_path: Path) -> tuple[str, dict, dict]:
         
         # Recurrir a hijos estructurales EN ORDEN
         for child in elem:
-            tag_local = child.tag.replace('{' + NS['ley'] + '}', '')
-            if tag_local in ['libro', 'titulo', 'capitulo', 'parrafo', 'seccion', 'articulo']:
+            if child.tag in TAG_A_DIVISION or child.tag in TAGS_ARTICULO:
                 extraer_textos_recursivo(child)
     
     if contenido_elem is not None:
@@ -101,9 +115,9 @@ def analizar_estructura_xml(xml_path: Path) -> dict:
     }
     
     def analizar_recursivo(elem, contexto=""):
-        tag_local = elem.tag.replace('{' + NS['ley'] + '}', '')
+        division = TAG_A_DIVISION.get(elem.tag)
         
-        if tag_local == 'articulo':
+        if elem.tag in TAGS_ARTICULO:
             numero = elem.get('numero', '')
             stats['articulos'].append(numero)
             
@@ -117,10 +131,10 @@ def analizar_estructura_xml(xml_path: Path) -> dict:
                 for _parr in contenido.findall('ley:parrafo', NS):
                     stats['parrafos_internos'] += 1
         
-        elif tag_local in ['libro', 'titulo', 'capitulo', 'parrafo', 'seccion']:
+        elif division is not None:
             titulo_sec = elem.find('ley:titulo_seccion', NS)
             titulo_text = titulo_sec.text if titulo_sec is not None else ''
-            stats['divisiones'][tag_local].append(titulo_text)
+            stats['divisiones'][division].append(titulo_text)
         
         # Recurrir
         for child in elem:
@@ -213,36 +227,29 @@ def run_test_archivo(xml_path: Path, verbose: bool = True) -> dict:
         }
         
         def contar_en_generado(elem):
-            # Obtener tag sin namespace
-            tag = elem.tag
-            if '}' in tag:
-                tag = tag.split('}')[1]
+            division = TAG_A_DIVISION.get(elem.tag)
             
-            if tag == 'articulo':
+            if elem.tag in TAGS_ARTICULO:
                 stats_parseado['articulos'].append(elem.get('numero', ''))
                 # Buscar incisos (con o sin namespace)
-                for inciso in list(elem.iter()):
-                    inciso_tag = inciso.tag.split('}')[-1] if '}' in inciso.tag else inciso.tag
-                    if inciso_tag == 'inciso':
+                for inciso in elem.iter():
+                    if inciso.tag in TAGS_INCISO:
                         stats_parseado['incisos'] += 1
                 # Buscar contenido
                 for child in elem:
-                    child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                    if child_tag == 'contenido':
+                    if child.tag in TAGS_CONTENIDO:
                         for subchild in child:
-                            subtag = subchild.tag.split('}')[-1] if '}' in subchild.tag else subchild.tag
-                            if subtag == 'parrafo':
+                            if subchild.tag in TAGS_PARRAFO:
                                 stats_parseado['parrafos_internos'] += 1
                         
-            elif tag in ['libro', 'titulo', 'capitulo', 'parrafo', 'seccion']:
+            elif division is not None:
                 # Buscar titulo_seccion
                 titulo_text = ''
                 for child in elem:
-                    child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                    if child_tag == 'titulo_seccion' and child.text:
+                    if child.tag in TAGS_TITULO_SECCION and child.text:
                         titulo_text = child.text
                         break
-                stats_parseado['divisiones'][tag].append(titulo_text)
+                stats_parseado['divisiones'][division].append(titulo_text)
             
             for child in elem:
                 contar_en_generado(child)
@@ -250,8 +257,7 @@ def run_test_archivo(xml_path: Path, verbose: bool = True) -> dict:
         # Buscar contenido (con o sin namespace)
         contenido_gen = None
         for child in root_generado:
-            child_tag = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-            if child_tag == 'contenido':
+            if child.tag in TAGS_CONTENIDO:
                 contenido_gen = child
                 break
         
@@ -278,10 +278,14 @@ JOSEFINA MONTENEGRO ARANEDA
 Superintendenta de Insolvencia y Reemprendimiento
 """
 
+    @classmethod
+    def setUpClass(cls):
+        # Los tests solo leen la norma: se parsea una vez para toda la clase.
+        cls.norma = SuperirStructuredParser().parse(cls.NCG4_TEXTO)
+
     def test_full_parse_produces_norma_superir(self):
         """Parse completo produce NormaSuperir válida."""
-        parser = SuperirStructuredParser()
-        norma = parser.parse(self.NCG4_TEXTO)
+        norma = self.norma
 
         # Tipo correcto
         self.assertIsInstance(norma, NormaSuperir)
@@ -309,9 +313,7 @@ Superintendenta de Insolvencia y Reemprendimiento
 
     def test_norma_base_compatible(self):
         """La Norma base tiene datos correctos."""
-        parser = SuperirStructuredParser()
-        norma = parser.parse(self.NCG4_TEXTO)
-        base = norma.norma_base
+        base = self.norma.norma_base
 
         self.assertEqual(base.identificador.tipo, "Norma de Carácter General")
         self.assertEqual(base.identificador.numero, "4")
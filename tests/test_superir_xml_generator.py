@@ -0,0 +1,190 @@
+"""Tests para SuperirXMLGenerator.
+
+Valida el XML generado desde una NCG parseada:
+- Conformidad con superir_v1.xsd
+- Considerandos individuales y fórmula de dictación
+- Artículos con epígrafe y listados letrados
+- Cierre (fórmula + firmante)
+"""
+
+import unittest
+
+from lxml import etree
+
+from leychile_epub.superir_structured_parser import SuperirStructuredParser
+from leychile_epub.superir_xml_generator import SUPERIR_NS, SuperirXMLGenerator
+
+NS = {"n": SUPERIR_NS}
+TAG_NORMA = f"{{{SUPERIR_NS}}}norma"
+TAG_ARTICULO = f"{{{SUPERIR_NS}}}articulo"
+TAG_PARRAFO = f"{{{SUPERIR_NS}}}parrafo"
+TAG_LISTADO = f"{{{SUPERIR_NS}}}listado"
+
+# NCG abreviada con la estructura de la NCG 6: considerandos, títulos,
+# un artículo con listado letrado y cierre con firmante.
+NCG_TEXTO = """REPÚBLICA DE CHILE
+Ministerio de Economía, Fomento y Turismo
+Superintendencia de Insolvencia y Reemprendimiento
+
+NORMA DE CARÁCTER GENERAL N.° 6
+SUPERINTENDENCIA DE INSOLVENCIA Y REEMPRENDIMIENTO
+
+REF.: Garantía de fiel desempeño del Veedor en el Procedimiento Concursal de Reorganización.
+
+Santiago, 5 de septiembre de 2014
+
+VISTOS
+
+Las facultades conferidas en el artículo 75° de la Ley N.° 20.720, sobre Reorganización y Liquidación de Activos de Empresas y Personas (en adelante, la "Ley").
+
+CONSIDERANDO
+
+1° Que, el artículo 75° de la Ley dispone que en caso que no se acuerde la reorganización y se declare la liquidación de la Empresa Deudora, el Veedor deberá otorgar una garantía.
+
+2° Que, es de la esencia de la disposición en comento, que la garantía sea de aquellas de fácil realización.
+
+3° Que, el mencionado artículo 75° se refiere al otorgamiento de cualquier instrumento de garantía.
+
+4° Que, en conformidad a lo anterior, esta Superintendencia dicta la siguiente:
+
+NORMA DE CARÁCTER GENERAL
+
+TÍTULO I
+Garantía de fiel desempeño
+
+Artículo 1°. Instrumentos de garantía.
+La garantía de fiel desempeño podrá constituirse mediante alguno de los siguientes instrumentos:
+
+a) Boleta de garantía bancaria.
+
+b) Póliza de seguro de ejecución inmediata.
+
+c) Depósito a plazo endosable.
+
+Artículo 2°. Plazo.
+La garantía deberá otorgarse dentro de los cinco días siguientes a la notificación de la resolución de liquidación.
+
+TÍTULO II
+Disposiciones Finales
+
+Artículo 3°. Vigencia.
+La presente Norma de Carácter General entrará en vigencia a contar de su publicación.
+
+Anótese y publíquese.
+
+JOSEFINA MONTENEGRO ARANEDA
+Superintendenta de Insolvencia y Reemprendimiento
+"""
+
+
+class TestGenerateNCG(unittest.TestCase):
+    """Test de integración: parse + generación XML de una NCG."""
+
+    @classmethod
+    def setUpClass(cls):
+        norma = SuperirStructuredParser().parse(NCG_TEXTO)
+        cls.root = SuperirXMLGenerator().generate_tree(norma)
+
+        cls.considerandos = cls.root.findall("n:considerandos/n:considerando", NS)
+        cls.articulos = {a.get("numero"): a for a in cls.root.iter(TAG_ARTICULO)}
+
+        cierre = cls.root.find("n:cierre", NS)
+        cls.cierre = {
+            "formula": cierre.findtext("n:formula", namespaces=NS),
+            "nombre": cierre.findtext("n:firmante/n:nombre", namespaces=NS),
+            "cargo": cierre.findtext("n:firmante/n:cargo", namespaces=NS),
+        }
+
+    def test_validates_xsd(self):
+        self.assertTrue(SuperirXMLGenerator()._validate(self.root))
+
+    def test_root_attributes(self):
+        self.assertEqual(self.root.tag, TAG_NORMA)
+        self.assertEqual(self.root.get("numero"), "6")
+        self.assertEqual(self.root.get("estado"), "vigente")
+
+    def test_three_considerandos(self):
+        self.assertEqual([c.get("numero") for c in self.considerandos], ["1", "2", "3"])
+
+    def test_considerandos_start_with_que(self):
+        for cons in self.considerandos:
+            with self.subTest(numero=cons.get("numero")):
+                self.assertTrue(cons.findtext("n:parrafo", namespaces=NS).startswith("Que,"))
+
+    def test_formula_dictacion(self):
+        formula = self.root.findtext("n:formula_dictacion", namespaces=NS)
+        self.assertIn("dicta la siguiente", formula)
+
+    def test_articulos_epigrafes(self):
+        epigrafes = [a.get("epigrafe") for a in self.articulos.values()]
+        self.assertEqual(epigrafes, ["Instrumentos de garantía", "Plazo", "Vigencia"])
+
+    def test_two_titulos(self):
+        titulos = self.root.findall("n:cuerpo_normativo/n:titulo", NS)
+        self.assertEqual([t.get("numero") for t in titulos], ["I", "II"])
+
+    def test_art1_parrafo_then_listado(self):
+        tags = [c.tag for c in self.articulos["1"]]
+        self.assertEqual(tags, [TAG_PARRAFO, TAG_LISTADO])
+
+    def test_art1_listado_three_items(self):
+        items = self.articulos["1"].findall("n:listado/n:item", NS)
+        self.assertEqual(tuple(i.get("letra") for i in items), ("a", "b", "c"))
+
+        textos = ("Boleta de garantía", "Póliza de seguro", "Depósito a plazo")
+        for item, texto in zip(items, textos, strict=True):
+            with self.subTest(letra=item.get("letra")):
+                self.assertIn(texto, item.text)
+
+    def test_cierre(self):
+        esperados = {
+            "formula": "Anótese y publíquese.",
+            "nombre": "JOSEFINA MONTENEGRO ARANEDA",
+            "cargo": "SUPERINTENDENTA DE INSOLVENCIA Y REEMPRENDIMIENTO",
+        }
+        for campo, valor in esperados.items():
+            with self.subTest(campo=campo):
+                self.assertEqual(self.cierre[campo], valor)
+
+    def test_no_anexos(self):
+        self.assertIsNone(self.root.find("n:anexo", NS))
+
+
+class TestGenerateString(unittest.TestCase):
+    """generate() serializa el mismo árbol que generate_tree()."""
+
+    def test_string_matches_tree(self):
+        gen = SuperirXMLGenerator()
+        norma = SuperirStructuredParser().parse(NCG_TEXTO)
+        tree = gen.generate_tree(norma)
+        xml_str = gen.generate(norma)
+
+        def nodos(root: etree._Element) -> list[tuple[str, str, dict[str, str]]]:
+            resultado = [(e.tag, (e.text or "").strip(), dict(e.attrib)) for e in root.iter()]
+            # "generado" en <norma> lleva la hora de cada llamada
+            resultado[0][2].pop("generado")
+            return resultado
+
+        parsed = etree.fromstring(xml_str.encode("utf-8"))
+        self.assertEqual(nodos(parsed), nodos(tree))
+
+
+class TestValidate(unittest.TestCase):
+    """Tests para _validate() sobre el árbol en memoria."""
+
+    def test_schema_shared_between_instances(self):
+        self.assertIs(SuperirXMLGenerator()._load_schema(), SuperirXMLGenerator()._load_schema())
+
+    def test_missing_schema_returns_none(self):
+        gen = SuperirXMLGenerator(schema_path="/no/existe/superir.xsd")
+        with self.assertLogs("leychile_epub.superir_xml_generator", level="WARNING"):
+            self.assertIsNone(gen._load_schema())
+
+    def test_invalid_tree_is_rejected(self):
+        root = etree.Element(TAG_NORMA)
+        with self.assertLogs("leychile_epub.superir_xml_generator", level="ERROR"):
+            self.assertFalse(SuperirXMLGenerator()._validate(root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,7 +15,7 @@ from leychile_epub.scraper_v2 import (
     NormaIdentificador,
     NormaMetadatos,
 )
-from leychile_epub.xml_generator import LawXMLGenerator
+from leychile_epub.xml_generator import _SCHEMA_PATH, LawXMLGenerator, _compile_schema
 
 
 @pytest.fixture
@@ -306,6 +306,26 @@ class TestGenerate:
             assert enc.find("ley:vistos", ns) is None
 
 
+class TestValidateXML:
+    """Tests para _validate_xml (validación contra ley_v1.xsd)."""
+
+    def test_schema_compiled_once(self):
+        """El XSD se compila una vez y se reutiliza entre validaciones."""
+        assert _compile_schema(_SCHEMA_PATH) is _compile_schema(_SCHEMA_PATH)
+
+    def test_valid_document_has_no_errors(self, sample_norma):
+        gen = LawXMLGenerator()
+        root = gen._create_root(sample_norma)
+        gen._add_metadata(root, sample_norma)
+        gen._add_contenido(root, sample_norma)
+        assert gen._validate_xml(root) == []
+
+    def test_invalid_document_reports_errors(self, sample_norma):
+        gen = LawXMLGenerator()
+        root = gen._create_root(sample_norma)
+        assert gen._validate_xml(root) != []
+
+
 class TestSuperirXMLGeneration:
     """Tests para generación XML de normas SUPERIR (NCG/Instructivos)."""
 
@@ -358,10 +378,11 @@ class TestSuperirXMLGeneration:
             ns = {"ley": "https://leychile.cl/schema/ley/v1"}
             enc = root.find("ley:encabezado", ns)
             assert enc is not None
-            assert enc.find("ley:vistos", ns) is not None
+            vistos = enc.find("ley:vistos", ns)
+            assert vistos is not None
             assert enc.find("ley:considerandos", ns) is not None
             assert enc.find("ley:texto", ns) is None
-            assert "46°" in enc.find("ley:vistos", ns).text
+            assert "46°" in vistos.text
 
     def test_disposiciones_finales_instead_of_promulgacion(self, superir_norma):
         """SUPERIR usa <disposiciones_finales> en vez de <promulgacion>."""